@@ -2,17 +2,298 @@
 # Para usar no Google Colab
 
 import sqlite3
+from collections import Counter
 from datetime import datetime, timedelta
 import hashlib
-import random
-import string
+import os
+import secrets
+
+# ========== COMANDOS SQL ==========
+# Mantidos como constantes do módulo para que o texto de cada comando seja
+# sempre o mesmo e o cache de comandos preparados da conexão seja reaproveitado.
+
+_SQL_INSERT_USUARIO = '''
+INSERT INTO usuarios (nome, email, senha, telefone, cpf_cnpj, tipo_usuario)
+VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_SELECT_USUARIOS_POR_TIPO = 'SELECT * FROM usuarios WHERE tipo_usuario = ?'
+
+_SQL_SELECT_USUARIOS = 'SELECT * FROM usuarios'
+
+_SQL_INSERT_EVENTO = '''
+INSERT INTO eventos (organizador_id, titulo, descricao, data_inicio, local,
+                     categoria, capacidade_maxima, vagas_disponiveis,
+                     valor_ingresso, gratuito)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_SELECT_EVENTOS_POR_STATUS = '''
+SELECT e.id, e.titulo, e.data_inicio, e.local, e.categoria,
+       e.vagas_disponiveis, e.capacidade_maxima, u.nome as organizador
+FROM eventos e
+JOIN usuarios u ON e.organizador_id = u.id
+WHERE e.status = ? AND e.status <> 'ativo'
+ORDER BY e.data_inicio
+'''
+
+# Eventos ativos ficam em consulta separada, com o status literal: o planner só
+# usa um índice parcial quando o WHERE implica a condição do índice. A negação
+# acima faz o mesmo com idx_eventos_inativos.
+_SQL_SELECT_EVENTOS_ATIVOS = '''
+SELECT e.id, e.titulo, e.data_inicio, e.local, e.categoria,
+       e.vagas_disponiveis, e.capacidade_maxima, u.nome as organizador
+FROM eventos e
+JOIN usuarios u ON e.organizador_id = u.id
+WHERE e.status = 'ativo'
+ORDER BY e.data_inicio
+'''
+
+_SQL_BUSCAR_EVENTOS = '''
+SELECT e.*, u.nome as organizador
+FROM eventos e
+JOIN usuarios u ON e.organizador_id = u.id
+WHERE e.status = 'ativo'
+'''
+_SQL_FILTRO_CATEGORIA = ' AND e.categoria = ?'
+_SQL_FILTRO_DATA_MIN = ' AND e.data_inicio >= ?'
+_SQL_ORDEM_DATA_INICIO = ' ORDER BY e.data_inicio'
+
+_SQL_RESERVAR_VAGA = '''
+UPDATE eventos
+SET vagas_disponiveis = vagas_disponiveis - 1
+WHERE id = ? AND status = 'ativo' AND vagas_disponiveis > 0
+'''
+
+_SQL_RESERVAR_VAGAS = '''
+UPDATE eventos
+SET vagas_disponiveis = vagas_disponiveis - ?
+WHERE id = ? AND status = 'ativo' AND vagas_disponiveis >= ?
+'''
+
+_SQL_SELECT_STATUS_EVENTO = 'SELECT status FROM eventos WHERE id = ?'
+
+_SQL_INSERT_INSCRICAO = '''
+INSERT INTO inscricoes (participante_id, evento_id, codigo_confirmacao)
+VALUES (?, ?, ?)
+'''
+
+_SQL_INSERT_LISTA_ESPERA = '''
+INSERT INTO lista_espera (participante_id, evento_id, posicao)
+SELECT ?, ?, COALESCE(MAX(posicao), 0) + 1
+FROM lista_espera
+WHERE evento_id = ?
+RETURNING posicao
+'''
+
+_SQL_CANCELAR_INSCRICAO = '''
+UPDATE inscricoes
+SET status = 'cancelada'
+WHERE participante_id = ? AND evento_id = ? AND status = 'confirmada'
+'''
+
+_SQL_LIBERAR_VAGA = '''
+UPDATE eventos
+SET vagas_disponiveis = vagas_disponiveis + 1
+WHERE id = ?
+'''
+
+_SQL_CHECKIN = '''
+UPDATE inscricoes
+SET presente = 1, status = 'presente', data_checkin = CURRENT_TIMESTAMP
+WHERE codigo_confirmacao = ? AND status = 'confirmada'
+'''
+
+_SQL_SELECT_INSCRICOES_PARTICIPANTE = '''
+SELECT e.titulo, e.data_inicio, e.local, i.status, i.codigo_confirmacao, i.presente
+FROM inscricoes i
+JOIN eventos e ON i.evento_id = e.id
+WHERE i.participante_id = ?
+ORDER BY e.data_inicio DESC
+'''
+
+# Só insere se o participante esteve presente no evento
+_SQL_INSERT_AVALIACAO = '''
+INSERT INTO avaliacoes (participante_id, evento_id, nota, comentario)
+SELECT ?, ?, ?, ?
+WHERE EXISTS (
+    SELECT 1 FROM inscricoes
+    WHERE participante_id = ? AND evento_id = ? AND presente = 1
+)
+'''
+
+_SQL_SELECT_AVALIACOES_EVENTO = '''
+SELECT u.nome, a.nota, a.comentario, a.data_avaliacao
+FROM avaliacoes a
+JOIN usuarios u ON a.participante_id = u.id
+WHERE a.evento_id = ?
+ORDER BY a.data_avaliacao DESC
+'''
+
+_SQL_STATS_AVALIACOES = '''
+SELECT AVG(nota) as media, COUNT(*) as total_avaliacoes
+FROM avaliacoes
+WHERE evento_id = ?
+'''
+
+_SQL_RELATORIO_EVENTO = '''
+SELECT e.titulo, e.data_inicio, e.local, e.categoria, e.capacidade_maxima,
+       u.nome as organizador,
+       (SELECT COUNT(*) FROM inscricoes WHERE evento_id = e.id) as total_inscricoes,
+       (SELECT COUNT(*) FROM inscricoes
+        WHERE evento_id = e.id AND status = 'confirmada') as confirmadas,
+       (SELECT COUNT(*) FROM inscricoes
+        WHERE evento_id = e.id AND status = 'cancelada') as canceladas,
+       (SELECT COUNT(*) FROM inscricoes
+        WHERE evento_id = e.id AND presente = 1) as presentes,
+       (SELECT AVG(nota) FROM avaliacoes WHERE evento_id = e.id) as media,
+       (SELECT COUNT(*) FROM avaliacoes WHERE evento_id = e.id) as total_avaliacoes
+FROM eventos e
+JOIN usuarios u ON e.organizador_id = u.id
+WHERE e.id = ?
+'''
+
+_SQL_EVENTOS_POR_CATEGORIA = '''
+SELECT categoria, COUNT(*) as total,
+       SUM(capacidade_maxima - vagas_disponiveis) as inscritos
+FROM eventos
+WHERE status = 'ativo'
+GROUP BY categoria
+ORDER BY total DESC
+'''
+
+_SQL_CREATE_EVENTOS = '''
+CREATE TABLE IF NOT EXISTS eventos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    organizador_id INTEGER NOT NULL,
+    titulo TEXT NOT NULL,
+    descricao TEXT,
+    data_inicio INTEGER NOT NULL CHECK(typeof(data_inicio) = 'integer'),
+    data_fim TIMESTAMP,
+    local TEXT NOT NULL,
+    categoria TEXT NOT NULL,
+    capacidade_maxima INTEGER NOT NULL,
+    vagas_disponiveis INTEGER NOT NULL CHECK(vagas_disponiveis >= 0),
+    valor_ingresso REAL DEFAULT 0,
+    gratuito BOOLEAN DEFAULT 1,
+    status TEXT DEFAULT 'ativo' CHECK(status IN ('ativo', 'cancelado', 'finalizado')),
+    data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (organizador_id) REFERENCES usuarios(id)
+)
+'''
+
+_COLUNAS_EVENTOS = (
+    'id, organizador_id, titulo, descricao, data_inicio, data_fim, local, categoria, '
+    'capacidade_maxima, vagas_disponiveis, valor_ingresso, gratuito, status, data_criacao'
+)
+
 
 # ========== CONFIGURAÇÃO DO BANCO DE DADOS ==========
 
+_CONN = None
+_READER_CONN = None
+
+def _configurar_conexao(conn):
+    """Aplica os PRAGMAs de desempenho (uma vez por conexão)"""
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute('PRAGMA cache_size=-20000')
+    conn.execute('PRAGMA foreign_keys=ON')
+    conn.execute('PRAGMA busy_timeout=5000')
+
 def criar_conexao():
-    """Cria conexão com o banco de dados SQLite"""
-    conn = sqlite3.connect('eventos_culturais.db')
-    return conn
+    """Retorna a conexão compartilhada com o banco de dados SQLite.
+
+    A conexão é aberta uma única vez e reaproveitada por todas as funções,
+    mantendo o cache de comandos preparados entre as chamadas.
+    """
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect('eventos_culturais.db', check_same_thread=False,
+                                cached_statements=256)
+        _CONN.row_factory = sqlite3.Row
+        _configurar_conexao(_CONN)
+    return _CONN
+
+def criar_conexao_leitura():
+    """Retorna a conexão compartilhada somente leitura, usada pelos relatórios.
+
+    Com WAL, as consultas feitas por ela não bloqueiam nem são bloqueadas
+    pelas escritas feitas na conexão principal.
+    """
+    global _READER_CONN
+    if _READER_CONN is None:
+        _READER_CONN = sqlite3.connect('eventos_culturais.db', check_same_thread=False,
+                                       cached_statements=256)
+        _READER_CONN.row_factory = sqlite3.Row
+        _configurar_conexao(_READER_CONN)
+        _READER_CONN.execute('PRAGMA query_only=1')
+    return _READER_CONN
+
+def fechar_conexao():
+    """Fecha as conexões compartilhadas (usar ao encerrar o sistema)"""
+    global _CONN, _READER_CONN
+    if _READER_CONN is not None:
+        _READER_CONN.close()
+        _READER_CONN = None
+    if _CONN is not None:
+        _CONN.close()
+        _CONN = None
+
+def _migrar_data_inicio(conn):
+    """Reconstrói a tabela eventos de bancos antigos (data_inicio em texto) com epoch.
+
+    Retorna False se a migração foi abortada; o banco fica como estava.
+    """
+    colunas = {row['name']: row['type'] for row in conn.execute('PRAGMA table_info(eventos)')}
+    if not colunas or colunas['data_inicio'].upper() == 'INTEGER':
+        return True
+    
+    # O criar_evento antigo aceitava qualquer texto: conferir tudo antes de mexer
+    invalidos = []
+    for row in conn.execute('SELECT id, data_inicio FROM eventos'):
+        try:
+            _para_epoch(row['data_inicio'])
+        except ValueError:
+            invalidos.append(row['id'])
+    if invalidos:
+        print(f"❌ Migração abortada: data_inicio fora do formato 'AAAA-MM-DD HH:MM:SS' "
+              f"nos eventos {invalidos}. Corrija essas datas e rode criar_tabelas() de novo.")
+        return False
+    
+    print("🔄 Migrando eventos.data_inicio para o novo formato...")
+    conn.create_function('para_epoch', 1, _para_epoch, deterministic=True)
+    # Roteiro de reconstrução de tabela do SQLite: sem checagem de FK durante a
+    # troca, e o RENAME legado mantém as referências de inscrições etc. em "eventos"
+    conn.execute('PRAGMA foreign_keys=OFF')
+    conn.execute('PRAGMA legacy_alter_table=ON')
+    try:
+        with conn:
+            conn.execute('BEGIN')
+            # Bancos antigos rodavam sem foreign_keys e podem ter linhas órfãs;
+            # só as violações criadas pela troca de tabela impedem a migração
+            orfas_antes = {tuple(row) for row in conn.execute('PRAGMA foreign_key_check')}
+            conn.execute('ALTER TABLE eventos RENAME TO eventos_antiga')
+            conn.execute(_SQL_CREATE_EVENTOS)
+            conn.execute(f'''
+            INSERT INTO eventos ({_COLUNAS_EVENTOS})
+            SELECT {_COLUNAS_EVENTOS.replace('data_inicio', 'para_epoch(data_inicio)')}
+            FROM eventos_antiga
+            ''')
+            # Os índices antigos somem junto e são recriados por criar_tabelas
+            conn.execute('DROP TABLE eventos_antiga')
+            orfas_depois = {tuple(row) for row in conn.execute('PRAGMA foreign_key_check')}
+            if orfas_depois - orfas_antes:
+                raise sqlite3.IntegrityError("chave estrangeira inválida após a migração")
+    except sqlite3.Error as e:
+        print(f"❌ Erro ao migrar a tabela eventos: {e}")
+        return False
+    finally:
+        conn.execute('PRAGMA legacy_alter_table=OFF')
+        conn.execute('PRAGMA foreign_keys=ON')
+    return True
 
 def criar_tabelas():
     """Cria todas as tabelas do sistema"""
@@ -33,26 +314,10 @@ def criar_tabelas():
     )
     ''')
     
-    # Tabela de Eventos
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS eventos (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        organizador_id INTEGER NOT NULL,
-        titulo TEXT NOT NULL,
-        descricao TEXT,
-        data_inicio TIMESTAMP NOT NULL,
-        data_fim TIMESTAMP,
-        local TEXT NOT NULL,
-        categoria TEXT NOT NULL,
-        capacidade_maxima INTEGER NOT NULL,
-        vagas_disponiveis INTEGER NOT NULL,
-        valor_ingresso REAL DEFAULT 0,
-        gratuito BOOLEAN DEFAULT 1,
-        status TEXT DEFAULT 'ativo' CHECK(status IN ('ativo', 'cancelado', 'finalizado')),
-        data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (organizador_id) REFERENCES usuarios(id)
-    )
-    ''')
+    # Tabela de Eventos (bancos antigos, com data_inicio em texto, são migrados)
+    if not _migrar_data_inicio(conn):
+        return
+    cursor.execute(_SQL_CREATE_EVENTOS)
     
     # Tabela de Inscrições
     cursor.execute('''
@@ -100,141 +365,206 @@ def criar_tabelas():
         UNIQUE(participante_id, evento_id)
     )
     ''')
-    
+
+    # Índices para chaves estrangeiras e filtros frequentes
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_eventos_org ON eventos(organizador_id)')
+    # (status, data_inicio) foi trocado pelos parciais idx_eventos_ativos/idx_eventos_inativos
+    cursor.execute('DROP INDEX IF EXISTS idx_eventos_status_data')
+    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_eventos_categoria ON eventos(categoria)
+                      WHERE status = 'ativo' ''')
+    # Sem status na chave: a contagem de confirmadas fica com idx_insc_confirmadas
+    cursor.execute('DROP INDEX IF EXISTS idx_insc_evento')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_insc_evento_id ON inscricoes(evento_id)')
+    # participante_id já é servido pelo índice de UNIQUE(participante_id, evento_id)
+    cursor.execute('DROP INDEX IF EXISTS idx_insc_part')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_espera_evento_pos ON lista_espera(evento_id, posicao DESC)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_aval_evento ON avaliacoes(evento_id)')
+    
+    # Índices parciais: as linhas "vivas", que são as mais consultadas, ficam num
+    # índice enxuto; os eventos cancelados/finalizados ficam em outro
+    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_eventos_ativos ON eventos(data_inicio)
+                      WHERE status = 'ativo' ''')
+    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_eventos_inativos ON eventos(status, data_inicio)
+                      WHERE status <> 'ativo' ''')
+    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_insc_confirmadas ON inscricoes(evento_id)
+                      WHERE status = 'confirmada' ''')
+
     conn.commit()
-    conn.close()
     print("✅ Tabelas criadas com sucesso!")
 
+# ========== DATAS ==========
+# eventos.data_inicio é guardado como INTEGER (segundos desde a época Unix)
+
+_FORMATO_DATA = '%Y-%m-%d %H:%M:%S'
+
+def _para_epoch(data):
+    """Converte datetime, texto ISO ('AAAA-MM-DD HH:MM:SS') ou epoch para epoch.
+
+    Levanta ValueError para qualquer outro valor.
+    """
+    if isinstance(data, (int, float)):
+        return int(data)
+    if isinstance(data, str):
+        data = datetime.fromisoformat(data)
+    if not isinstance(data, datetime):
+        raise ValueError(f"data inválida: {data!r}")
+    return int(data.timestamp())
+
+def _formatar_data(epoch):
+    """Formata um epoch para exibição"""
+    return datetime.fromtimestamp(epoch).strftime(_FORMATO_DATA)
+
+# ========== EXIBIÇÃO ==========
+
+_TAMANHO_LOTE = 1000
+
+# Representação de cada nota (1 a 5) já montada
+_ESTRELAS = tuple('⭐' * nota for nota in range(6))
+
+# Separadores, cabeçalhos e formatos de linha das listagens (montados uma vez)
+_HR60, _HR80, _HR100 = '=' * 60, '=' * 80, '=' * 100
+
+_HDR_USUARIOS = f"{'ID':<5} {'Nome':<25} {'Email':<30} {'Tipo':<15}"
+_FMT_USUARIOS = '{:<5} {:<25} {:<30} {:<15}'
+
+_HDR_EVENTOS = f"{'ID':<5} {'Título':<30} {'Data':<20} {'Local':<20} {'Vagas':<10}"
+_FMT_EVENTOS = '{:<5} {:<30} {:<20} {:<20} {:<10}'
+
+_HDR_INSCRICOES = f"{'Evento':<30} {'Data':<20} {'Local':<20} {'Status':<15} {'Presente'}"
+_FMT_INSCRICOES = '{:<30} {:<20} {:<20} {:<15} {}'
+
+_HDR_AVALIACOES = f"{'Participante':<25} {'Nota':<10} {'Comentário'}"
+_FMT_AVALIACOES = '{:<25} {:<10} {}'
+
+_HDR_CATEGORIAS = f"{'Categoria':<30} {'Eventos':<15} {'Inscritos'}"
+_FMT_CATEGORIAS = '{:<30} {:<15} {}'
+
+def _imprimir_em_lotes(cursor, formatar):
+    """Imprime as linhas do cursor em lotes, sem materializar o resultado.
+
+    Retorna a quantidade de linhas impressas.
+    """
+    total = 0
+    while True:
+        lote = cursor.fetchmany(_TAMANHO_LOTE)
+        if not lote:
+            return total
+        print('\n'.join(map(formatar, lote)))
+        total += len(lote)
+
 # ========== FUNÇÕES DE USUÁRIOS ==========
 
+def _hash_senha(senha):
+    """Gera o hash da senha com scrypt e salt aleatório ('salt:hash' em hex)"""
+    salt = os.urandom(16)
+    dk = hashlib.scrypt(senha.encode(), salt=salt, n=2**14, r=8, p=1, dklen=32)
+    return salt.hex() + ':' + dk.hex()
+
 def cadastrar_usuario(nome, email, senha, telefone, cpf_cnpj, tipo_usuario):
     """Cadastra um novo usuário no sistema"""
     conn = criar_conexao()
     cursor = conn.cursor()
     
-    # Hash da senha (segurança básica)
-    senha_hash = hashlib.sha256(senha.encode()).hexdigest()
+    senha_hash = _hash_senha(senha)
     
     try:
-        cursor.execute('''
-        INSERT INTO usuarios (nome, email, senha, telefone, cpf_cnpj, tipo_usuario)
-        VALUES (?, ?, ?, ?, ?, ?)
-        ''', (nome, email, senha_hash, telefone, cpf_cnpj, tipo_usuario))
-        
-        conn.commit()
-        usuario_id = cursor.lastrowid
-        print(f"✅ Usuário cadastrado com sucesso! ID: {usuario_id}")
-        return usuario_id
+        with conn:
+            cursor.execute(_SQL_INSERT_USUARIO,
+                           (nome, email, senha_hash, telefone, cpf_cnpj, tipo_usuario))
     except sqlite3.IntegrityError as e:
         print(f"❌ Erro: {e}")
         return None
-    finally:
-        conn.close()
+    
+    usuario_id = cursor.lastrowid
+    print(f"✅ Usuário cadastrado com sucesso! ID: {usuario_id}")
+    return usuario_id
 
 def listar_usuarios(tipo=None):
-    """Lista todos os usuários ou por tipo"""
-    conn = criar_conexao()
+    """Lista todos os usuários ou por tipo (retorna a quantidade listada)"""
+    conn = criar_conexao_leitura()
     cursor = conn.cursor()
     
     if tipo:
-        cursor.execute('SELECT * FROM usuarios WHERE tipo_usuario = ?', (tipo,))
+        cursor.execute(_SQL_SELECT_USUARIOS_POR_TIPO, (tipo,))
     else:
-        cursor.execute('SELECT * FROM usuarios')
+        cursor.execute(_SQL_SELECT_USUARIOS)
     
-    usuarios = cursor.fetchall()
-    conn.close()
+    print('\n' + _HR80)
+    print(_HDR_USUARIOS)
+    print(_HR80)
     
-    print(f"\n{'='*80}")
-    print(f"{'ID':<5} {'Nome':<25} {'Email':<30} {'Tipo':<15}")
-    print(f"{'='*80}")
+    total = _imprimir_em_lotes(cursor, lambda u: _FMT_USUARIOS.format(u[0], u[1], u[2], u[6]))
     
-    for user in usuarios:
-        print(f"{user[0]:<5} {user[1]:<25} {user[2]:<30} {user[6]:<15}")
-    
-    print(f"{'='*80}\n")
-    return usuarios
+    print(_HR80 + '\n')
+    return total
 
 # ========== FUNÇÕES DE EVENTOS ==========
 
 def criar_evento(organizador_id, titulo, descricao, data_inicio, local, categoria, 
                  capacidade_maxima, valor_ingresso=0, gratuito=True):
-    """Cria um novo evento cultural"""
+    """Cria um novo evento cultural (data_inicio: datetime, texto ISO ou epoch)"""
     conn = criar_conexao()
     cursor = conn.cursor()
     
     try:
-        cursor.execute('''
-        INSERT INTO eventos (organizador_id, titulo, descricao, data_inicio, local, 
-                           categoria, capacidade_maxima, vagas_disponiveis, 
-                           valor_ingresso, gratuito)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (organizador_id, titulo, descricao, data_inicio, local, categoria,
-              capacidade_maxima, capacidade_maxima, valor_ingresso, gratuito))
-        
-        conn.commit()
-        evento_id = cursor.lastrowid
-        print(f"✅ Evento criado com sucesso! ID: {evento_id}")
-        return evento_id
+        data_inicio = _para_epoch(data_inicio)
+        with conn:
+            cursor.execute(_SQL_INSERT_EVENTO,
+                           (organizador_id, titulo, descricao, data_inicio, local, categoria,
+                            capacidade_maxima, capacidade_maxima, valor_ingresso, gratuito))
     except Exception as e:
         print(f"❌ Erro ao criar evento: {e}")
         return None
-    finally:
-        conn.close()
+    
+    evento_id = cursor.lastrowid
+    print(f"✅ Evento criado com sucesso! ID: {evento_id}")
+    return evento_id
 
 def listar_eventos(status='ativo'):
-    """Lista eventos por status"""
-    conn = criar_conexao()
+    """Lista eventos por status (retorna a quantidade listada)"""
+    conn = criar_conexao_leitura()
     cursor = conn.cursor()
     
-    cursor.execute('''
-    SELECT e.id, e.titulo, e.data_inicio, e.local, e.categoria, 
-           e.vagas_disponiveis, e.capacidade_maxima, u.nome as organizador
-    FROM eventos e
-    JOIN usuarios u ON e.organizador_id = u.id
-    WHERE e.status = ?
-    ORDER BY e.data_inicio
-    ''', (status,))
-    
-    eventos = cursor.fetchall()
-    conn.close()
+    if status == 'ativo':
+        cursor.execute(_SQL_SELECT_EVENTOS_ATIVOS)
+    else:
+        cursor.execute(_SQL_SELECT_EVENTOS_POR_STATUS, (status,))
     
-    print(f"\n{'='*100}")
-    print(f"{'ID':<5} {'Título':<30} {'Data':<20} {'Local':<20} {'Vagas':<10}")
-    print(f"{'='*100}")
+    print('\n' + _HR100)
+    print(_HDR_EVENTOS)
+    print(_HR100)
     
-    for evento in eventos:
-        vagas_info = f"{evento[5]}/{evento[6]}"
-        print(f"{evento[0]:<5} {evento[1]:<30} {evento[2]:<20} {evento[3]:<20} {vagas_info:<10}")
+    total = _imprimir_em_lotes(
+        cursor, lambda e: _FMT_EVENTOS.format(e[0], e[1], _formatar_data(e[2]), e[3], f"{e[5]}/{e[6]}"))
     
-    print(f"{'='*100}\n")
-    return eventos
+    print(_HR100 + '\n')
+    return total
 
 def buscar_eventos(categoria=None, data_min=None):
-    """Busca eventos por filtros"""
-    conn = criar_conexao()
+    """Busca eventos por filtros (data_min: datetime, texto ISO ou epoch)"""
+    conn = criar_conexao_leitura()
     cursor = conn.cursor()
     
-    query = '''
-    SELECT e.*, u.nome as organizador
-    FROM eventos e
-    JOIN usuarios u ON e.organizador_id = u.id
-    WHERE e.status = 'ativo'
-    '''
+    query = _SQL_BUSCAR_EVENTOS
     params = []
     
     if categoria:
-        query += ' AND e.categoria = ?'
+        query += _SQL_FILTRO_CATEGORIA
         params.append(categoria)
     
     if data_min:
-        query += ' AND e.data_inicio >= ?'
+        try:
+            data_min = _para_epoch(data_min)
+        except ValueError as e:
+            print(f"❌ Data mínima inválida: {e}")
+            return []
+        query += _SQL_FILTRO_DATA_MIN
         params.append(data_min)
     
-    query += ' ORDER BY e.data_inicio'
+    query += _SQL_ORDEM_DATA_INICIO
     
     cursor.execute(query, params)
     eventos = cursor.fetchall()
-    conn.close()
     
     return eventos
 
@@ -242,161 +572,156 @@ def buscar_eventos(categoria=None, data_min=None):
 
 def gerar_codigo_confirmacao():
     """Gera código único de confirmação"""
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
+    return secrets.token_urlsafe(8).upper()
 
 def inscrever_participante(participante_id, evento_id):
     """Inscreve um participante em um evento"""
     conn = criar_conexao()
     cursor = conn.cursor()
     
-    # Verificar vagas disponíveis
-    cursor.execute('SELECT vagas_disponiveis FROM eventos WHERE id = ?', (evento_id,))
-    resultado = cursor.fetchone()
-    
-    if not resultado:
-        print("❌ Evento não encontrado!")
-        conn.close()
-        return None
-    
-    vagas_disponiveis = resultado[0]
-    
-    if vagas_disponiveis <= 0:
-        print("❌ Não há vagas disponíveis! Deseja entrar na lista de espera?")
-        conn.close()
-        return 'lista_espera'
-    
     codigo = gerar_codigo_confirmacao()
     
     try:
-        cursor.execute('''
-        INSERT INTO inscricoes (participante_id, evento_id, codigo_confirmacao)
-        VALUES (?, ?, ?)
-        ''', (participante_id, evento_id, codigo))
-        
-        # Atualizar vagas disponíveis
-        cursor.execute('''
-        UPDATE eventos 
-        SET vagas_disponiveis = vagas_disponiveis - 1
-        WHERE id = ?
-        ''', (evento_id,))
-        
-        conn.commit()
-        inscricao_id = cursor.lastrowid
-        print(f"✅ Inscrição realizada com sucesso!")
-        print(f"📋 Código de confirmação: {codigo}")
-        return inscricao_id
+        with conn:
+            cursor.execute('BEGIN IMMEDIATE')
+            
+            # Reservar a vaga de forma atômica (sem SELECT prévio). A condição
+            # vagas_disponiveis > 0 no WHERE faz "evento lotado" aparecer como
+            # rowcount 0, separado do IntegrityError de inscrição duplicada; por
+            # isso o CHECK(vagas_disponiveis >= 0) nunca dispara aqui e é só
+            # uma rede de segurança no esquema
+            cursor.execute(_SQL_RESERVAR_VAGA, (evento_id,))
+            
+            if cursor.rowcount == 0:
+                # Caminho de falha: descobrir o motivo
+                cursor.execute(_SQL_SELECT_STATUS_EVENTO, (evento_id,))
+                resultado = cursor.fetchone()
+                if not resultado:
+                    print("❌ Evento não encontrado!")
+                    return None
+                if resultado['status'] != 'ativo':
+                    print("❌ Este evento não está aberto para inscrições!")
+                    return None
+                print("❌ Não há vagas disponíveis! Deseja entrar na lista de espera?")
+                return 'lista_espera'
+            
+            cursor.execute(_SQL_INSERT_INSCRICAO, (participante_id, evento_id, codigo))
     except sqlite3.IntegrityError:
         print("❌ Você já está inscrito neste evento!")
         return None
-    finally:
-        conn.close()
+    
+    inscricao_id = cursor.lastrowid
+    print(f"✅ Inscrição realizada com sucesso!")
+    print(f"📋 Código de confirmação: {codigo}")
+    return inscricao_id
 
-def adicionar_lista_espera(participante_id, evento_id):
-    """Adiciona participante à lista de espera"""
+def _inscrever_em_massa(cursor, pares):
+    """Reserva as vagas e grava as inscrições de `pares` na transação corrente.
+
+    Faz um UPDATE por evento (com o total de vagas daquele evento) e um único
+    executemany para as inscrições. Retorna os códigos de confirmação na ordem
+    de `pares`.
+    """
+    por_evento = Counter(evento_id for _, evento_id in pares)
+    cursor.executemany(_SQL_RESERVAR_VAGAS,
+                       [(qtd, evento_id, qtd) for evento_id, qtd in por_evento.items()])
+    if cursor.rowcount != len(por_evento):
+        raise sqlite3.IntegrityError("evento inativo, inexistente ou sem vagas suficientes")
+    
+    codigos = [gerar_codigo_confirmacao() for _ in pares]
+    cursor.executemany(_SQL_INSERT_INSCRICAO,
+                       [(part, ev, codigo) for (part, ev), codigo in zip(pares, codigos)])
+    return codigos
+
+def inscrever_em_massa(pares):
+    """Inscreve vários pares (participante_id, evento_id) em uma única transação.
+
+    Para importações e cargas em lote; se qualquer inscrição falhar, nenhuma é
+    gravada. Retorna a lista de códigos de confirmação ou None em caso de erro.
+    """
     conn = criar_conexao()
     cursor = conn.cursor()
     
-    # Obter próxima posição
-    cursor.execute('''
-    SELECT COALESCE(MAX(posicao), 0) + 1 
-    FROM lista_espera 
-    WHERE evento_id = ?
-    ''', (evento_id,))
+    pares = list(pares)
+    try:
+        with conn:
+            codigos = _inscrever_em_massa(cursor, pares)
+    except sqlite3.IntegrityError as e:
+        print(f"❌ Erro nas inscrições em massa: {e}")
+        return None
     
-    posicao = cursor.fetchone()[0]
+    print(f"✅ {len(codigos)} inscrições realizadas com sucesso!")
+    return codigos
+
+def adicionar_lista_espera(participante_id, evento_id):
+    """Adiciona participante à lista de espera"""
+    conn = criar_conexao()
+    cursor = conn.cursor()
     
     try:
-        cursor.execute('''
-        INSERT INTO lista_espera (participante_id, evento_id, posicao)
-        VALUES (?, ?, ?)
-        ''', (participante_id, evento_id, posicao))
-        
-        conn.commit()
-        print(f"✅ Adicionado à lista de espera na posição {posicao}")
-        return True
+        with conn:
+            # Próxima posição calculada e gravada no mesmo comando
+            cursor.execute(_SQL_INSERT_LISTA_ESPERA, (participante_id, evento_id, evento_id))
+            posicao = cursor.fetchone()['posicao']
     except sqlite3.IntegrityError:
         print("❌ Você já está na lista de espera deste evento!")
         return False
-    finally:
-        conn.close()
+    
+    print(f"✅ Adicionado à lista de espera na posição {posicao}")
+    return True
 
 def cancelar_inscricao(participante_id, evento_id):
     """Cancela uma inscrição e libera vaga"""
     conn = criar_conexao()
     cursor = conn.cursor()
     
-    try:
-        cursor.execute('''
-        UPDATE inscricoes 
-        SET status = 'cancelada'
-        WHERE participante_id = ? AND evento_id = ? AND status = 'confirmada'
-        ''', (participante_id, evento_id))
+    with conn:
+        cursor.execute(_SQL_CANCELAR_INSCRICAO, (participante_id, evento_id))
+        cancelada = cursor.rowcount > 0
         
-        if cursor.rowcount > 0:
+        if cancelada:
             # Liberar vaga
-            cursor.execute('''
-            UPDATE eventos 
-            SET vagas_disponiveis = vagas_disponiveis + 1
-            WHERE id = ?
-            ''', (evento_id,))
-            
-            conn.commit()
-            print("✅ Inscrição cancelada com sucesso!")
-            return True
-        else:
-            print("❌ Inscrição não encontrada ou já cancelada!")
-            return False
-    finally:
-        conn.close()
+            cursor.execute(_SQL_LIBERAR_VAGA, (evento_id,))
+    
+    if cancelada:
+        print("✅ Inscrição cancelada com sucesso!")
+        return True
+    else:
+        print("❌ Inscrição não encontrada ou já cancelada!")
+        return False
 
 def realizar_checkin(codigo_confirmacao):
     """Realiza check-in no evento usando código"""
     conn = criar_conexao()
     cursor = conn.cursor()
     
-    try:
-        cursor.execute('''
-        UPDATE inscricoes 
-        SET presente = 1, status = 'presente', data_checkin = CURRENT_TIMESTAMP
-        WHERE codigo_confirmacao = ? AND status = 'confirmada'
-        ''', (codigo_confirmacao,))
-        
-        if cursor.rowcount > 0:
-            conn.commit()
-            print("✅ Check-in realizado com sucesso!")
-            return True
-        else:
-            print("❌ Código inválido ou check-in já realizado!")
-            return False
-    finally:
-        conn.close()
+    with conn:
+        cursor.execute(_SQL_CHECKIN, (codigo_confirmacao,))
+    
+    if cursor.rowcount > 0:
+        print("✅ Check-in realizado com sucesso!")
+        return True
+    else:
+        print("❌ Código inválido ou check-in já realizado!")
+        return False
 
 def listar_minhas_inscricoes(participante_id):
-    """Lista todas as inscrições de um participante"""
-    conn = criar_conexao()
+    """Lista todas as inscrições de um participante (retorna a quantidade listada)"""
+    conn = criar_conexao_leitura()
     cursor = conn.cursor()
     
-    cursor.execute('''
-    SELECT e.titulo, e.data_inicio, e.local, i.status, i.codigo_confirmacao, i.presente
-    FROM inscricoes i
-    JOIN eventos e ON i.evento_id = e.id
-    WHERE i.participante_id = ?
-    ORDER BY e.data_inicio DESC
-    ''', (participante_id,))
+    cursor.execute(_SQL_SELECT_INSCRICOES_PARTICIPANTE, (participante_id,))
     
-    inscricoes = cursor.fetchall()
-    conn.close()
+    print('\n' + _HR100)
+    print(_HDR_INSCRICOES)
+    print(_HR100)
     
-    print(f"\n{'='*100}")
-    print(f"{'Evento':<30} {'Data':<20} {'Local':<20} {'Status':<15} {'Presente'}")
-    print(f"{'='*100}")
+    total = _imprimir_em_lotes(
+        cursor, lambda i: _FMT_INSCRICOES.format(i[0], _formatar_data(i[1]), i[2], i[3],
+                                                 '✓' if i[5] else '✗'))
     
-    for insc in inscricoes:
-        presente = '✓' if insc[5] else '✗'
-        print(f"{insc[0]:<30} {insc[1]:<20} {insc[2]:<20} {insc[3]:<15} {presente}")
-    
-    print(f"{'='*100}\n")
-    return inscricoes
+    print(_HR100 + '\n')
+    return total
 
 # ========== FUNÇÕES DE AVALIAÇÕES ==========
 
@@ -405,183 +730,117 @@ def avaliar_evento(participante_id, evento_id, nota, comentario=""):
     conn = criar_conexao()
     cursor = conn.cursor()
     
-    # Verificar se participou
-    cursor.execute('''
-    SELECT presente FROM inscricoes 
-    WHERE participante_id = ? AND evento_id = ?
-    ''', (participante_id, evento_id))
-    
-    resultado = cursor.fetchone()
-    
-    if not resultado or not resultado[0]:
-        print("❌ Você precisa ter participado do evento para avaliá-lo!")
-        conn.close()
-        return False
-    
     try:
-        cursor.execute('''
-        INSERT INTO avaliacoes (participante_id, evento_id, nota, comentario)
-        VALUES (?, ?, ?, ?)
-        ''', (participante_id, evento_id, nota, comentario))
-        
-        conn.commit()
-        print("✅ Avaliação registrada com sucesso!")
-        return True
+        with conn:
+            # A verificação de presença é feita no próprio INSERT
+            cursor.execute(_SQL_INSERT_AVALIACAO, (participante_id, evento_id, nota, comentario,
+                                                   participante_id, evento_id))
     except sqlite3.IntegrityError:
         print("❌ Você já avaliou este evento!")
         return False
-    finally:
-        conn.close()
+    
+    if cursor.rowcount == 0:
+        print("❌ Você precisa ter participado do evento para avaliá-lo!")
+        return False
+    
+    print("✅ Avaliação registrada com sucesso!")
+    return True
 
 def visualizar_avaliacoes(evento_id):
-    """Visualiza todas as avaliações de um evento"""
-    conn = criar_conexao()
+    """Visualiza todas as avaliações de um evento (retorna o total de avaliações)"""
+    conn = criar_conexao_leitura()
     cursor = conn.cursor()
     
-    cursor.execute('''
-    SELECT u.nome, a.nota, a.comentario, a.data_avaliacao
-    FROM avaliacoes a
-    JOIN usuarios u ON a.participante_id = u.id
-    WHERE a.evento_id = ?
-    ORDER BY a.data_avaliacao DESC
-    ''', (evento_id,))
-    
-    avaliacoes = cursor.fetchall()
-    
-    if avaliacoes:
-        # Calcular média
-        cursor.execute('''
-        SELECT AVG(nota) as media, COUNT(*) as total
-        FROM avaliacoes
-        WHERE evento_id = ?
-        ''', (evento_id,))
-        
-        stats = cursor.fetchone()
-        
-        print(f"\n{'='*80}")
-        print(f"📊 Média de Avaliações: {stats[0]:.1f}/5.0 ({stats[1]} avaliações)")
-        print(f"{'='*80}")
-        print(f"{'Participante':<25} {'Nota':<10} {'Comentário'}")
-        print(f"{'='*80}")
+    # Calcular média (e saber se há avaliações) antes de listar
+    cursor.execute(_SQL_STATS_AVALIACOES, (evento_id,))
+    
+    stats = cursor.fetchone()
+    
+    if stats['total_avaliacoes']:
+        print('\n' + _HR80)
+        print(f"📊 Média de Avaliações: {stats['media']:.1f}/5.0 ({stats['total_avaliacoes']} avaliações)")
+        print(_HR80)
+        print(_HDR_AVALIACOES)
+        print(_HR80)
         
-        for av in avaliacoes:
-            estrelas = '⭐' * av[1]
-            print(f"{av[0]:<25} {estrelas:<10} {av[2] if av[2] else ''}")
+        cursor.execute(_SQL_SELECT_AVALIACOES_EVENTO, (evento_id,))
+        _imprimir_em_lotes(cursor, lambda av: _FMT_AVALIACOES.format(av[0], _ESTRELAS[av[1]], av[2] or ''))
         
-        print(f"{'='*80}\n")
+        print(_HR80 + '\n')
     else:
         print("ℹ️  Nenhuma avaliação disponível para este evento.")
     
-    conn.close()
-    return avaliacoes
+    return stats['total_avaliacoes']
 
 # ========== RELATÓRIOS E CONSULTAS ==========
 
 def relatorio_evento(evento_id):
     """Gera relatório completo de um evento"""
-    conn = criar_conexao()
+    conn = criar_conexao_leitura()
     cursor = conn.cursor()
     
-    # Dados do evento
-    cursor.execute('''
-    SELECT e.*, u.nome as organizador
-    FROM eventos e
-    JOIN usuarios u ON e.organizador_id = u.id
-    WHERE e.id = ?
-    ''', (evento_id,))
+    # Dados do evento, estatísticas de inscrições e avaliações em uma só consulta
+    cursor.execute(_SQL_RELATORIO_EVENTO, (evento_id,))
     
     evento = cursor.fetchone()
     
     if not evento:
         print("❌ Evento não encontrado!")
-        conn.close()
         return
     
-    # Estatísticas de inscrições
-    cursor.execute('''
-    SELECT 
-        COUNT(*) as total_inscricoes,
-        SUM(CASE WHEN status = 'confirmada' THEN 1 ELSE 0 END) as confirmadas,
-        SUM(CASE WHEN status = 'cancelada' THEN 1 ELSE 0 END) as canceladas,
-        SUM(CASE WHEN presente = 1 THEN 1 ELSE 0 END) as presentes
-    FROM inscricoes
-    WHERE evento_id = ?
-    ''', (evento_id,))
-    
-    stats = cursor.fetchone()
-    
-    # Avaliações
-    cursor.execute('''
-    SELECT AVG(nota) as media, COUNT(*) as total_avaliacoes
-    FROM avaliacoes
-    WHERE evento_id = ?
-    ''', (evento_id,))
-    
-    aval_stats = cursor.fetchone()
-    
-    conn.close()
-    
     # Exibir relatório
-    print(f"\n{'='*80}")
+    print('\n' + _HR80)
     print(f"📊 RELATÓRIO DO EVENTO")
-    print(f"{'='*80}")
-    print(f"Título: {evento[2]}")
-    print(f"Organizador: {evento[13]}")
-    print(f"Data: {evento[4]}")
-    print(f"Local: {evento[6]}")
-    print(f"Categoria: {evento[7]}")
-    print(f"Capacidade: {evento[8]} pessoas")
-    print(f"\n{'='*80}")
+    print(_HR80)
+    print(f"Título: {evento['titulo']}")
+    print(f"Organizador: {evento['organizador']}")
+    print(f"Data: {_formatar_data(evento['data_inicio'])}")
+    print(f"Local: {evento['local']}")
+    print(f"Categoria: {evento['categoria']}")
+    print(f"Capacidade: {evento['capacidade_maxima']} pessoas")
+    print('\n' + _HR80)
     print(f"📈 ESTATÍSTICAS DE INSCRIÇÕES")
-    print(f"{'='*80}")
-    print(f"Total de Inscrições: {stats[0]}")
-    print(f"Confirmadas: {stats[1]}")
-    print(f"Canceladas: {stats[2]}")
-    print(f"Presentes: {stats[3]}")
-    
-    if stats[1] > 0:
-        taxa_comparecimento = (stats[3] / stats[1]) * 100
+    print(_HR80)
+    print(f"Total de Inscrições: {evento['total_inscricoes']}")
+    print(f"Confirmadas: {evento['confirmadas']}")
+    print(f"Canceladas: {evento['canceladas']}")
+    print(f"Presentes: {evento['presentes']}")
+    
+    if evento['confirmadas'] > 0:
+        taxa_comparecimento = (evento['presentes'] / evento['confirmadas']) * 100
         print(f"Taxa de Comparecimento: {taxa_comparecimento:.1f}%")
     
-    print(f"\n{'='*80}")
+    print('\n' + _HR80)
     print(f"⭐ AVALIAÇÕES")
-    print(f"{'='*80}")
+    print(_HR80)
     
-    if aval_stats[1] > 0:
-        print(f"Média de Avaliação: {aval_stats[0]:.1f}/5.0")
-        print(f"Total de Avaliações: {aval_stats[1]}")
+    if evento['total_avaliacoes'] > 0:
+        print(f"Média de Avaliação: {evento['media']:.1f}/5.0")
+        print(f"Total de Avaliações: {evento['total_avaliacoes']}")
     else:
         print("Nenhuma avaliação disponível")
     
-    print(f"{'='*80}\n")
+    print(_HR80 + '\n')
 
 def eventos_por_categoria():
     """Exibe estatísticas de eventos por categoria"""
-    conn = criar_conexao()
+    conn = criar_conexao_leitura()
     cursor = conn.cursor()
     
-    cursor.execute('''
-    SELECT categoria, COUNT(*) as total, 
-           SUM(capacidade_maxima - vagas_disponiveis) as inscritos
-    FROM eventos
-    WHERE status = 'ativo'
-    GROUP BY categoria
-    ORDER BY total DESC
-    ''')
+    cursor.execute(_SQL_EVENTOS_POR_CATEGORIA)
     
     categorias = cursor.fetchall()
-    conn.close()
     
-    print(f"\n{'='*60}")
+    print('\n' + _HR60)
     print(f"📊 EVENTOS POR CATEGORIA")
-    print(f"{'='*60}")
-    print(f"{'Categoria':<30} {'Eventos':<15} {'Inscritos'}")
-    print(f"{'='*60}")
+    print(_HR60)
+    print(_HDR_CATEGORIAS)
+    print(_HR60)
     
     for cat in categorias:
-        print(f"{cat[0]:<30} {cat[1]:<15} {cat[2]}")
+        print(_FMT_CATEGORIAS.format(cat[0], cat[1], cat[2]))
     
-    print(f"{'='*60}\n")
+    print(_HR60 + '\n')
 
 # ========== DADOS DE EXEMPLO ==========
 
@@ -589,49 +848,77 @@ def popular_dados_exemplo():
     """Popula o banco com dados de exemplo para demonstração"""
     print("📝 Populando banco de dados com dados de exemplo...\n")
     
-    # Cadastrar usuários
-    print("👥 Cadastrando usuários...")
-    org1 = cadastrar_usuario("Maria Silva", "maria@cultura.com", "senha123", 
-                             "21999991111", "12345678901", "organizador")
-    org2 = cadastrar_usuario("João Santos", "joao@eventos.com", "senha456",
-                             "21999992222", "98765432100", "organizador")
-    
-    part1 = cadastrar_usuario("Ana Costa", "ana@email.com", "senha789",
-                              "21999993333", "11122233344", "participante")
-    part2 = cadastrar_usuario("Pedro Oliveira", "pedro@email.com", "senha321",
-                              "21999994444", "55566677788", "participante")
-    part3 = cadastrar_usuario("Julia Mendes", "julia@email.com", "senha654",
-                              "21999995555", "99988877766", "participante")
-    
-    patrocinador = cadastrar_usuario("Empresa Cultural LTDA", "contato@empresa.com", 
-                                     "senha987", "21999996666", "12345678000199", "patrocinador")
-    
-    # Criar eventos
-    print("\n🎭 Criando eventos...")
-    data_evento1 = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S')
-    data_evento2 = (datetime.now() + timedelta(days=14)).strftime('%Y-%m-%d %H:%M:%S')
-    data_evento3 = (datetime.now() + timedelta(days=21)).strftime('%Y-%m-%d %H:%M:%S')
-    
-    ev1 = criar_evento(org1, "Festival de Música Popular", 
-                      "Grande festival com artistas locais", data_evento1,
-                      "Praça Central", "Música", 100, 0, True)
-    
-    ev2 = criar_evento(org1, "Oficina de Teatro Comunitário",
-                      "Aprenda técnicas básicas de teatro", data_evento2,
-                      "Centro Cultural", "Teatro", 30, 0, True)
-    
-    ev3 = criar_evento(org2, "Exposição de Arte Contemporânea",
-                      "Obras de artistas locais emergentes", data_evento3,
-                      "Galeria Municipal", "Artes Visuais", 50, 0, True)
-    
-    # Realizar inscrições
-    print("\n📝 Realizando inscrições...")
-    inscrever_participante(part1, ev1)
-    inscrever_participante(part2, ev1)
-    inscrever_participante(part3, ev1)
-    inscrever_participante(part1, ev2)
-    inscrever_participante(part2, ev3)
+    conn = criar_conexao()
+    cursor = conn.cursor()
     
+    usuarios = [
+        ("Maria Silva", "maria@cultura.com", "senha123",
+         "21999991111", "12345678901", "organizador"),
+        ("João Santos", "joao@eventos.com", "senha456",
+         "21999992222", "98765432100", "organizador"),
+        ("Ana Costa", "ana@email.com", "senha789",
+         "21999993333", "11122233344", "participante"),
+        ("Pedro Oliveira", "pedro@email.com", "senha321",
+         "21999994444", "55566677788", "participante"),
+        ("Julia Mendes", "julia@email.com", "senha654",
+         "21999995555", "99988877766", "participante"),
+        ("Empresa Cultural LTDA", "contato@empresa.com", "senha987",
+         "21999996666", "12345678000199", "patrocinador"),
+    ]
+    
+    try:
+        # Tudo em uma única transação: um só commit para todo o seed
+        with conn:
+            cursor.execute('BEGIN')
+            
+            # Cadastrar usuários
+            print("👥 Cadastrando usuários...")
+            cursor.executemany(_SQL_INSERT_USUARIO,
+                               [(nome, email, _hash_senha(senha), telefone, cpf_cnpj, tipo)
+                                for nome, email, senha, telefone, cpf_cnpj, tipo in usuarios])
+            
+            emails = [u[1] for u in usuarios]
+            cursor.execute(f'''
+            SELECT email, id FROM usuarios WHERE email IN ({','.join('?' * len(emails))})
+            ''', emails)
+            ids = dict(cursor.fetchall())
+            org1, org2, part1, part2, part3 = (ids[email] for email in emails[:5])
+            
+            # Criar eventos
+            print("\n🎭 Criando eventos...")
+            data_evento1 = int((datetime.now() + timedelta(days=7)).timestamp())
+            data_evento2 = int((datetime.now() + timedelta(days=14)).timestamp())
+            data_evento3 = int((datetime.now() + timedelta(days=21)).timestamp())
+            
+            eventos = [
+                (org1, "Festival de Música Popular",
+                 "Grande festival com artistas locais", data_evento1,
+                 "Praça Central", "Música", 100, 100, 0, True),
+                (org1, "Oficina de Teatro Comunitário",
+                 "Aprenda técnicas básicas de teatro", data_evento2,
+                 "Centro Cultural", "Teatro", 30, 30, 0, True),
+                (org2, "Exposição de Arte Contemporânea",
+                 "Obras de artistas locais emergentes", data_evento3,
+                 "Galeria Municipal", "Artes Visuais", 50, 50, 0, True),
+            ]
+            ids_eventos = []
+            for evento in eventos:
+                cursor.execute(_SQL_INSERT_EVENTO, evento)
+                ids_eventos.append(cursor.lastrowid)
+            ev1, ev2, ev3 = ids_eventos
+            
+            # Realizar inscrições
+            print("\n📝 Realizando inscrições...")
+            inscricoes = [(part1, ev1), (part2, ev1), (part3, ev1), (part1, ev2), (part2, ev3)]
+            _inscrever_em_massa(cursor, inscricoes)
+    except sqlite3.IntegrityError as e:
+        print(f"❌ Erro ao popular dados de exemplo: {e}")
+        return
+    
+    # Só depois do commit: nada foi gravado se a transação falhou
+    print(f"✅ {len(usuarios)} usuários cadastrados")
+    print(f"✅ {len(eventos)} eventos criados")
+    print(f"✅ {len(inscricoes)} inscrições realizadas")
     print("\n✅ Banco de dados populado com sucesso!")
     print("\nℹ️  Use as funções abaixo para interagir com o sistema:")
     print("   - listar_usuarios()")
@@ -643,7 +930,7 @@ def popular_dados_exemplo():
 
 if __name__ == "__main__":
     print("🎭 SISTEMA DE GESTÃO DE EVENTOS CULTURAIS")
-    print("="*80)
+    print(_HR80)
     print("\n Criando estrutura do banco de dados...\n")
     
     criar_tabelas()
@@ -666,4 +953,7 @@ if __name__ == "__main__":
     print("realizar_checkin('ABC123XYZ')")
     print("\n# Avaliar evento:")
     print("avaliar_evento(3, 1, 5, 'Evento maravilhoso!')")
-    print("-"*80)
\ No newline at end of file
+    print("-"*80)
+    
+    # Encerramento: as conexões compartilhadas são reabertas sob demanda
+    fechar_conexao()